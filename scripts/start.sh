@@ -10,4 +10,8 @@ export PYTHONPATH="${PYTHONPATH}:$(pwd)/src"
 exec uvicorn app.main:app \
     --host "${HOST:-0.0.0.0}" \
     --port "${PORT:-8000}" \
-    --workers "${WORKERS:-4}"
+    --workers "${WORKERS:-$((2 * $(nproc)))}" \
+    --loop uvloop \
+    --http httptools \
+    --backlog "${BACKLOG:-2048}" \
+    --limit-concurrency "${LIMIT_CONCURRENCY:-1000}"
@@ -0,0 +1,30 @@
+"""Optional Cython compilation for hot service and schema modules.
+
+The application is pure Python by default. Setting COMPILE_CYTHON=1 at build
+time compiles the per-request service and schema glue to C extensions,
+removing interpreter dispatch on those modules:
+
+    COMPILE_CYTHON=1 pip install -e .
+
+Leave the flag unset during development so --reload keeps working against
+the .py sources.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("COMPILE_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            "src/services/*.py",
+            "src/schemas/*.py",
+        ],
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+
+setup(ext_modules=ext_modules)
@@ -1,12 +1,15 @@
 """Authentication endpoints."""
 
-from dataclasses import asdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
-from dependencies import CurrentUser, DBSession
+from core.token_cache import TTLCache
+from dependencies import CurrentUser, DBSession, json_body
+from schemas import to_response
 from schemas.token import Token
 from schemas.user import UserCreate, UserResponse
 from services.auth_service import AuthService
@@ -14,33 +17,47 @@ from services.user_service import UserService
 
 router = APIRouter()
 
+# /me is polled far more often than a user record changes, so the encoded
+# response body is memoized per (id, updated_at) — the key rotates on any
+# write to the user, which makes invalidation automatic.
+_me_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30.0)
+
 
 @router.post("/register", response_model=UserResponse, status_code=201)
-async def register(user_in: UserCreate, db: DBSession) -> UserResponse:
+async def register(
+    user_in: Annotated[UserCreate, Depends(json_body(UserCreate))], db: DBSession
+) -> ORJSONResponse:
     """Register a new user."""
     user_service = UserService(db)
     user = await user_service.create(user_in)
-    return UserResponse(**asdict(user))
+    return ORJSONResponse(to_response(UserResponse, user).model_dump(), status_code=201)
 
 
 @router.post("/login", response_model=Token)
 async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: DBSession,
-) -> Token:
+) -> ORJSONResponse:
     """Login and get access token."""
     auth_service = AuthService(db)
-    return await auth_service.login(form_data.username, form_data.password)
+    token = await auth_service.login(form_data.username, form_data.password)
+    return ORJSONResponse(token.model_dump())
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(refresh_token: str, db: DBSession) -> Token:
+async def refresh_token(refresh_token: str, db: DBSession) -> ORJSONResponse:
     """Refresh access token."""
     auth_service = AuthService(db)
-    return await auth_service.refresh_token(refresh_token)
+    token = await auth_service.refresh_token(refresh_token)
+    return ORJSONResponse(token.model_dump())
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: CurrentUser) -> UserResponse:
+async def get_current_user_info(current_user: CurrentUser) -> Response:
     """Get current user information."""
-    return UserResponse(**asdict(current_user))
+    key = (current_user.id, current_user.updated_at)
+    body = _me_cache.get(key)
+    if body is None:
+        body = orjson.dumps(to_response(UserResponse, current_user).model_dump())
+        _me_cache.set(key, body)
+    return Response(content=body, media_type="application/json")
@@ -1,17 +1,23 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Probes hit these endpoints continuously, so the responses are encoded once
+# at import time and returned as-is, skipping response-model validation and
+# JSON serialization entirely.
+_HEALTHY = Response(content=b'{"status":"healthy"}', media_type="application/json")
+_READY = Response(content=b'{"status":"ready"}', media_type="application/json")
 
-@router.get("/")
-async def health_check() -> dict:
+
+@router.get("/", response_class=Response)
+async def health_check() -> Response:
     """Basic health check endpoint."""
-    return {"status": "healthy"}
+    return _HEALTHY
 
 
-@router.get("/ready")
-async def readiness_check() -> dict:
+@router.get("/ready", response_class=Response)
+async def readiness_check() -> Response:
     """Readiness check endpoint."""
-    return {"status": "ready"}
+    return _READY
@@ -1,50 +1,58 @@
 """Item management endpoints."""
 
-from dataclasses import asdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 
-from dependencies import CurrentUser, DBSession
-from dependencies.pagination import PaginationParams
-from schemas.common import Message, PaginatedResponse
-from schemas.item import ItemCreate, ItemResponse, ItemUpdate
+from dependencies import CurrentUser, DBSession, json_body
+from dependencies.pagination import CursorPaginationParams
+from schemas import PaginatedItemResponse, to_response
+from schemas.common import Message
+from schemas.item import ITEM_LIST_ADAPTER, ItemCreate, ItemResponse, ItemUpdate
 from services.item_service import ItemService
 
 router = APIRouter()
 
 
-@router.get("/", response_model=PaginatedResponse[ItemResponse])
+@router.get("/", response_model=PaginatedItemResponse)
 async def list_items(
     db: DBSession,
     current_user: CurrentUser,
-    pagination: Annotated[PaginationParams, Depends()],
-) -> PaginatedResponse[ItemResponse]:
+    pagination: Annotated[CursorPaginationParams, Depends()],
+) -> Response:
     """List all items for the current user."""
     item_service = ItemService(db)
-    items = await item_service.get_list_by_owner(
-        current_user.id, skip=pagination.skip, limit=pagination.limit
+    items, total = await item_service.get_list_by_owner(
+        current_user.id,
+        after_id=pagination.after_id,
+        limit=pagination.limit,
+        include_total=pagination.include_total,
     )
-    total = await item_service.count_by_owner(current_user.id)
 
-    return PaginatedResponse(
-        items=[ItemResponse(**asdict(item)) for item in items],
-        total=total,
-        skip=pagination.skip,
+    page = PaginatedItemResponse.model_construct(
+        items=ITEM_LIST_ADAPTER.validate_python(items, from_attributes=True),
         limit=pagination.limit,
+        next_cursor=items[-1].id if items else None,
+        total=total,
+        # model_construct skips validators, so set has_more explicitly.
+        has_more=len(items) >= pagination.limit,
     )
+    # Serialize the whole envelope in one pydantic-core (Rust) pass instead
+    # of model_dump() building an intermediate dict for orjson to re-walk.
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.post("/", response_model=ItemResponse, status_code=201)
 async def create_item(
-    item_in: ItemCreate,
+    item_in: Annotated[ItemCreate, Depends(json_body(ItemCreate))],
     db: DBSession,
     current_user: CurrentUser,
-) -> ItemResponse:
+) -> ORJSONResponse:
     """Create a new item."""
     item_service = ItemService(db)
     item = await item_service.create(item_in, owner_id=current_user.id)
-    return ItemResponse(**asdict(item))
+    return ORJSONResponse(to_response(ItemResponse, item).model_dump(), status_code=201)
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
@@ -52,24 +60,24 @@ async def get_item(
     item_id: int,
     db: DBSession,
     current_user: CurrentUser,
-) -> ItemResponse:
+) -> ORJSONResponse:
     """Get an item by ID."""
     item_service = ItemService(db)
     item = await item_service.get_by_id_for_user(item_id, current_user)
-    return ItemResponse(**asdict(item))
+    return ORJSONResponse(to_response(ItemResponse, item).model_dump())
 
 
 @router.patch("/{item_id}", response_model=ItemResponse)
 async def update_item(
     item_id: int,
-    item_in: ItemUpdate,
+    item_in: Annotated[ItemUpdate, Depends(json_body(ItemUpdate))],
     db: DBSession,
     current_user: CurrentUser,
-) -> ItemResponse:
+) -> ORJSONResponse:
     """Update an item."""
     item_service = ItemService(db)
     item = await item_service.update(item_id, item_in, current_user)
-    return ItemResponse(**asdict(item))
+    return ORJSONResponse(to_response(ItemResponse, item).model_dump())
 
 
 @router.delete("/{item_id}", response_model=Message)
@@ -77,8 +85,8 @@ async def delete_item(
     item_id: int,
     db: DBSession,
     current_user: CurrentUser,
-) -> Message:
+) -> ORJSONResponse:
     """Delete an item."""
     item_service = ItemService(db)
     await item_service.delete(item_id, current_user)
-    return Message(message="Item deleted successfully")
+    return ORJSONResponse({"message": "Item deleted successfully"})
@@ -1,35 +1,42 @@
 """User management endpoints."""
 
-from dataclasses import asdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 
-from dependencies import CurrentSuperuser, CurrentUser, DBSession
-from dependencies.pagination import PaginationParams
-from schemas.common import Message, PaginatedResponse
-from schemas.user import UserResponse, UserUpdate
+from dependencies import CurrentSuperuser, CurrentUser, DBSession, json_body
+from dependencies.pagination import CursorPaginationParams
+from schemas import PaginatedUserResponse, to_response
+from schemas.common import Message
+from schemas.user import USER_LIST_ADAPTER, UserResponse, UserUpdate
 from services.user_service import UserService
 
 router = APIRouter()
 
 
-@router.get("/", response_model=PaginatedResponse[UserResponse])
+@router.get("/", response_model=PaginatedUserResponse)
 async def list_users(
     db: DBSession,
     current_user: CurrentSuperuser,
-    pagination: Annotated[PaginationParams, Depends()],
-) -> PaginatedResponse[UserResponse]:
+    pagination: Annotated[CursorPaginationParams, Depends()],
+) -> Response:
     """List all users (admin only)."""
     user_service = UserService(db)
-    users = await user_service.get_list(pagination.skip, pagination.limit)
-    total = await user_service.count()
-    return PaginatedResponse(
-        items=[UserResponse(**asdict(u)) for u in users],
-        total=total,
-        skip=pagination.skip,
+    users, total = await user_service.get_list(
+        pagination.after_id, pagination.limit, include_total=pagination.include_total
+    )
+    page = PaginatedUserResponse.model_construct(
+        items=USER_LIST_ADAPTER.validate_python(users, from_attributes=True),
         limit=pagination.limit,
+        next_cursor=users[-1].id if users else None,
+        total=total,
+        # model_construct skips validators, so set has_more explicitly.
+        has_more=len(users) >= pagination.limit,
     )
+    # Serialize the whole envelope in one pydantic-core (Rust) pass instead
+    # of model_dump() building an intermediate dict for orjson to re-walk.
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -37,24 +44,24 @@ async def get_user(
     user_id: int,
     db: DBSession,
     current_user: CurrentUser,
-) -> UserResponse:
+) -> ORJSONResponse:
     """Get a specific user by ID."""
     user_service = UserService(db)
     user = await user_service.get_by_id(user_id)
-    return UserResponse(**asdict(user))
+    return ORJSONResponse(to_response(UserResponse, user).model_dump())
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
 async def update_user(
     user_id: int,
-    user_in: UserUpdate,
+    user_in: Annotated[UserUpdate, Depends(json_body(UserUpdate))],
     db: DBSession,
     current_user: CurrentUser,
-) -> UserResponse:
+) -> ORJSONResponse:
     """Update a user."""
     user_service = UserService(db)
     user = await user_service.update(user_id, user_in)
-    return UserResponse(**asdict(user))
+    return ORJSONResponse(to_response(UserResponse, user).model_dump())
 
 
 @router.delete("/{user_id}", response_model=Message)
@@ -62,8 +69,8 @@ async def delete_user(
     user_id: int,
     db: DBSession,
     current_user: CurrentSuperuser,
-) -> Message:
+) -> ORJSONResponse:
     """Delete a user (admin only)."""
     user_service = UserService(db)
     await user_service.delete(user_id)
-    return Message(message="User deleted successfully")
+    return ORJSONResponse({"message": "User deleted successfully"})
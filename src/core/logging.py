@@ -11,6 +11,12 @@ def setup_logging() -> None:
     """Configure application logging."""
     log_level = logging.DEBUG if settings.debug else logging.INFO
 
+    # Nothing in the log format uses thread/process info, so skip collecting
+    # it; the stdlib gathers it for every record by default.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logging.basicConfig(
         level=log_level,
         format="%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
@@ -32,6 +38,7 @@ class LoggerAdapter(logging.LoggerAdapter):
     """Logger adapter with extra context."""
 
     def process(self, msg: str, kwargs: Any) -> tuple[str, Any]:
-        extra = self.extra or {}
-        extra_str = " ".join(f"{k}={v}" for k, v in extra.items())
-        return f"{msg} | {extra_str}" if extra_str else msg, kwargs
+        if not self.extra:
+            return msg, kwargs
+        extra_str = " ".join(f"{k}={v}" for k, v in self.extra.items())
+        return f"{msg} | {extra_str}", kwargs
@@ -0,0 +1,47 @@
+"""In-process TTL cache for hot authentication lookups."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a fixed TTL.
+
+    Intended for per-process caching of short-lived hot lookups (e.g. decoded
+    JWT token -> user). Safe to use from asyncio handlers without a lock
+    because every operation is synchronous and never yields to the event loop.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
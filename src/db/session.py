@@ -1,8 +1,9 @@
 """Database session management using raw SQL queries."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
+from itertools import combinations
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
 
 from core.config import settings
@@ -11,8 +12,15 @@ engine = create_async_engine(
     str(settings.database_url),
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=1800,
+    connect_args={
+        "statement_cache_size": settings.db_statement_cache_size,
+        # JIT compilation only pays off for long analytical queries; for the
+        # short OLTP statements here it just adds planning latency.
+        "server_settings": {"jit": "off"},
+    },
 )
 
 
@@ -27,29 +35,66 @@ async def get_db() -> AsyncGenerator[AsyncConnection, None]:
             raise
 
 
-async def execute_query(conn: AsyncConnection, query: str, params: dict | None = None):
+def build_update_statements(
+    table: str, columns: Sequence[str], key_param: str, returning: str
+) -> dict[frozenset[str], TextClause]:
+    """Pre-build UPDATE statements for every non-empty subset of columns.
+
+    Services use this at import time to replace per-request f-string SQL
+    assembly with a dict lookup keyed by the updated-field set. Because only
+    enumerated column names ever reach the SQL text, it also removes runtime
+    interpolation of field names entirely, and each subset always produces
+    the identical string, keeping statement caches effective.
+    """
+    statements: dict[frozenset[str], TextClause] = {}
+    for r in range(1, len(columns) + 1):
+        for combo in combinations(sorted(columns), r):
+            set_clauses = ", ".join(f"{col} = :{col}" for col in combo)
+            statements[frozenset(combo)] = text(f"""
+                UPDATE {table}
+                SET {set_clauses}, updated_at = NOW()
+                WHERE id = :{key_param}
+                RETURNING {returning}
+            """)
+    return statements
+
+
+def _to_clause(query: str | TextClause) -> TextClause:
+    """Wrap a raw SQL string in text(), passing pre-built clauses through.
+
+    Callers on hot paths should build their TextClause once at import time so
+    the bind-parameter parsing in text() is not repeated per request.
+    """
+    return query if isinstance(query, TextClause) else text(query)
+
+
+async def execute_query(
+    conn: AsyncConnection, query: str | TextClause, params: dict | None = None
+):
     """Execute a raw SQL query and return the result."""
-    result = await conn.execute(text(query), params or {})
+    result = await conn.execute(_to_clause(query), params or {})
     return result
 
 
-async def fetch_one(conn: AsyncConnection, query: str, params: dict | None = None):
-    """Execute query and fetch one row as dict."""
-    result = await conn.execute(text(query), params or {})
-    row = result.fetchone()
-    if row:
-        return dict(row._mapping)
-    return None
+async def fetch_one(
+    conn: AsyncConnection, query: str | TextClause, params: dict | None = None
+):
+    """Execute query and fetch one row, or None."""
+    result = await conn.execute(_to_clause(query), params or {})
+    return result.fetchone()
 
 
-async def fetch_all(conn: AsyncConnection, query: str, params: dict | None = None):
-    """Execute query and fetch all rows as list of dicts."""
-    result = await conn.execute(text(query), params or {})
-    rows = result.fetchall()
-    return [dict(row._mapping) for row in rows]
+async def fetch_all(
+    conn: AsyncConnection, query: str | TextClause, params: dict | None = None
+):
+    """Execute query and fetch all rows."""
+    result = await conn.execute(_to_clause(query), params or {})
+    return result.fetchall()
 
 
-async def fetch_scalar(conn: AsyncConnection, query: str, params: dict | None = None):
+async def fetch_scalar(
+    conn: AsyncConnection, query: str | TextClause, params: dict | None = None
+):
     """Execute query and fetch single scalar value."""
-    result = await conn.execute(text(query), params or {})
+    result = await conn.execute(_to_clause(query), params or {})
     return result.scalar()
@@ -7,16 +7,18 @@ from dependencies.auth import (
     get_current_active_superuser,
     get_current_user,
 )
+from dependencies.body import json_body
 from dependencies.database import get_db
-from dependencies.pagination import Pagination, PaginationParams
+from dependencies.pagination import CursorPagination, CursorPaginationParams
 
 __all__ = [
     "get_db",
+    "json_body",
     "get_current_user",
     "get_current_active_superuser",
     "CurrentUser",
     "CurrentSuperuser",
     "DBSession",
-    "Pagination",
-    "PaginationParams",
+    "CursorPagination",
+    "CursorPaginationParams",
 ]
@@ -1,5 +1,7 @@
 """Authentication dependencies for FastAPI."""
 
+import hashlib
+import time
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
@@ -8,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 
 from core.exceptions import NotFoundError
 from core.security import SymmetricJWT
+from core.token_cache import TTLCache
 from dependencies.database import get_db
 from models.user import User
 from services.user_service import UserService
@@ -15,12 +18,25 @@ from services.user_service import UserService
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 _jwt = SymmetricJWT()
 
+# Tokens are immutable until expiry, so a verified token -> user mapping can
+# be cached briefly to skip the HMAC verification and DB round-trip that
+# otherwise run on every authenticated request.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60.0)
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncConnection, Depends(get_db)],
 ) -> User:
     """Get current authenticated user from JWT token."""
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _user_cache.get(cache_key)
+    if cached is not None:
+        user, exp = cached
+        if exp > time.time():
+            return user
+        _user_cache.invalidate(cache_key)
+
     payload = _jwt.decode(token)
     if not payload or payload.get("type") != "access":
         raise HTTPException(
@@ -45,6 +61,8 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Inactive user",
         )
+
+    _user_cache.set(cache_key, (user, int(payload.get("exp", 0))))
     return user
 
 
@@ -5,18 +5,31 @@ from typing import Annotated
 from fastapi import Query
 
 
-class PaginationParams:
-    """Pagination parameters for list endpoints."""
+class CursorPaginationParams:
+    """Keyset (cursor) pagination parameters for list endpoints.
+
+    Pages are addressed by the id of the last item already seen (`after_id`)
+    instead of a row offset, so the database never scans and discards skipped
+    rows. Totals require a separate full count, so they are opt-in via
+    `include_total`.
+    """
 
     def __init__(
         self,
-        skip: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
+        after_id: Annotated[
+            int | None,
+            Query(ge=0, description="Return items with id greater than this cursor"),
+        ] = None,
         limit: Annotated[
             int, Query(ge=1, le=100, description="Number of items to return")
         ] = 20,
+        include_total: Annotated[
+            bool, Query(description="Include the total count (extra query cost)")
+        ] = False,
     ) -> None:
-        self.skip = skip
+        self.after_id = after_id
         self.limit = limit
+        self.include_total = include_total
 
 
-Pagination = Annotated[PaginationParams, Query()]
+CursorPagination = Annotated[CursorPaginationParams, Query()]
@@ -3,18 +3,27 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import uvloop
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from api.v1.api import api_router
 from core.config import settings
 from core.logging import setup_logging
+from core.security import warm_password_backend
 from middleware import setup_cors, setup_exception_handlers
 
+# Replace the default asyncio event loop with uvloop (~2x faster socket I/O)
+# regardless of how the app is launched. Installing the policy after the
+# imports is safe: no event loop exists until the server starts one.
+uvloop.install()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup/shutdown events."""
     setup_logging()
+    warm_password_backend()
     yield
 
 
@@ -27,6 +36,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
         openapi_url="/openapi.json" if settings.debug else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -8,9 +8,11 @@ from core.config import settings
 
 def setup_cors(app: FastAPI) -> None:
     """Configure CORS middleware for the application."""
+    # Starlette expects a sequence, so the frozenset is materialized once
+    # here at startup.
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.cors_origins,
+        allow_origins=sorted(settings.cors_origins),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
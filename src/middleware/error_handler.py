@@ -1,7 +1,7 @@
 """Error handling middleware."""
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from core.exceptions import AppException
 
@@ -10,8 +10,8 @@ def setup_exception_handlers(app: FastAPI) -> None:
     """Setup custom exception handlers for the application."""
 
     @app.exception_handler(AppException)
-    async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
-        return JSONResponse(
+    async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": exc.message,
@@ -22,8 +22,8 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal server error",
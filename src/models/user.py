@@ -3,10 +3,17 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from sqlalchemy import Row
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
-    """User data class representing a user record."""
+    """User data class representing a user record.
+
+    slots=True drops the per-instance __dict__, and from_row unpacks rows
+    positionally — the field order below must match the SELECT column order
+    used by UserService.
+    """
 
     id: int
     email: str
@@ -18,18 +25,20 @@ class User:
     updated_at: datetime
 
     @classmethod
-    def from_row(cls, row: dict) -> "User":
-        """Create User instance from database row dict."""
-        return cls(
-            id=row["id"],
-            email=row["email"],
-            hashed_password=row["hashed_password"],
-            full_name=row.get("full_name"),
-            is_active=row["is_active"],
-            is_superuser=row["is_superuser"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+    def from_row(cls, row: Row | tuple) -> "User":
+        """Create User instance from a row in service column order."""
+        return cls(*row)
+
+    @classmethod
+    def from_rows(cls, rows: list[Row] | list[tuple]) -> "list[User]":
+        """Create User instances for a whole result set in one comprehension.
+
+        The tight positional-unpack loop stays in a single bytecode frame
+        instead of a method call per row.
+        """
+        return [cls(*row) for row in rows]
 
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, email={self.email})>"
+        # %-formatting: one C-level call, cheaper than an f-string for the
+        # two-field reprs that debug logging stringifies per request.
+        return "<User(id=%s, email=%s)>" % (self.id, self.email)  # noqa: UP031
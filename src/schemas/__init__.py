@@ -1,13 +1,83 @@
-"""Pydantic schemas package."""
+"""Pydantic schemas package.
+
+Names are resolved lazily (PEP 562): importing `schemas` no longer imports
+every submodule and builds each model's core schema up front — a name is
+loaded on first attribute access and cached back into the module globals, so
+only the models a process actually touches pay their schema-build cost.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from schemas.common import Message, PaginatedResponse, PaginationParams
+    from schemas.item import ItemCreate, ItemResponse, ItemUpdate
+    from schemas.token import Token, TokenPayload
+    from schemas.user import UserCreate, UserResponse, UserUpdate
+
+    PaginatedUserResponse = PaginatedResponse[UserResponse]
+    PaginatedItemResponse = PaginatedResponse[ItemResponse]
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def to_response(model_cls: type[_M], obj: Any) -> _M:
+    """Build a response model from a trusted, DB-backed object.
+
+    Rows coming out of the services were validated on write, so re-running
+    the pydantic validators (EmailStr regex, datetime coercion, type checks)
+    per response row is wasted work. model_construct copies the declared
+    fields straight off the source object. Only use this for data read from
+    our own database — untrusted input must go through model_validate.
+    """
+    return model_cls.model_construct(
+        **{name: getattr(obj, name) for name in model_cls.model_fields}
+    )
+
+
+_EXPORTS = {
+    "Message": "schemas.common",
+    "PaginatedResponse": "schemas.common",
+    "PaginationParams": "schemas.common",
+    "ItemCreate": "schemas.item",
+    "ItemResponse": "schemas.item",
+    "ItemUpdate": "schemas.item",
+    "Token": "schemas.token",
+    "TokenPayload": "schemas.token",
+    "UserCreate": "schemas.user",
+    "UserResponse": "schemas.user",
+    "UserUpdate": "schemas.user",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        obj = getattr(import_module(_EXPORTS[name]), name)
+    elif name == "PaginatedUserResponse":
+        from schemas.common import PaginatedResponse
+        from schemas.user import UserResponse
+
+        obj = PaginatedResponse[UserResponse]
+    elif name == "PaginatedItemResponse":
+        from schemas.common import PaginatedResponse
+        from schemas.item import ItemResponse
+
+        obj = PaginatedResponse[ItemResponse]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache so subsequent accesses hit the module dict, not __getattr__.
+    globals()[name] = obj
+    return obj
 
-from schemas.common import Message, PaginatedResponse, PaginationParams
-from schemas.item import ItemCreate, ItemResponse, ItemUpdate
-from schemas.token import Token, TokenPayload
-from schemas.user import UserCreate, UserResponse, UserUpdate
 
 __all__ = [
+    "to_response",
     "Message",
     "PaginatedResponse",
+    "PaginatedItemResponse",
+    "PaginatedUserResponse",
     "PaginationParams",
     "ItemCreate",
     "ItemResponse",
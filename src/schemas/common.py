@@ -2,7 +2,7 @@
 
 from typing import Generic, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 T = TypeVar("T")
 
@@ -21,13 +21,22 @@ class PaginationParams(BaseModel):
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Paginated response wrapper."""
+    """Keyset-paginated response wrapper.
+
+    `next_cursor` is the id of the last item in the page and should be passed
+    back as `after_id` to fetch the next page. `total` is only populated when
+    the client opts in via `include_total`. `has_more` is computed once at
+    construction (a full page means there may be more) and serialized like a
+    plain field; callers building pages via model_construct must pass it.
+    """
 
     items: list[T]
-    total: int
-    skip: int
     limit: int
-
-    @property
-    def has_more(self) -> bool:
-        return self.skip + len(self.items) < self.total
+    next_cursor: int | None = None
+    total: int | None = None
+    has_more: bool = False
+
+    @model_validator(mode="after")
+    def _set_has_more(self) -> "PaginatedResponse[T]":
+        self.has_more = len(self.items) >= self.limit
+        return self
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class ItemBase(BaseModel):
@@ -34,3 +34,9 @@ class ItemResponse(ItemBase):
     owner_id: int
     created_at: datetime
     updated_at: datetime
+
+
+# Built once at import: TypeAdapter construction compiles a core schema, so a
+# per-request instance would redo that work. Converts a whole page of rows in
+# a single pydantic-core pass instead of one Python-level call per row.
+ITEM_LIST_ADAPTER: TypeAdapter[list[ItemResponse]] = TypeAdapter(list[ItemResponse])
@@ -2,19 +2,23 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
 
-    email: EmailStr
     full_name: str | None = None
 
 
 class UserCreate(UserBase):
-    """Schema for creating a new user."""
+    """Schema for creating a new user.
+
+    Inputs validate the email address; responses deliberately do not (see
+    UserResponse).
+    """
 
+    email: EmailStr
     password: str
 
 
@@ -28,12 +32,24 @@ class UserUpdate(BaseModel):
 
 
 class UserResponse(UserBase):
-    """Schema for user response."""
+    """Schema for user response.
+
+    `email` is a plain str here: addresses were validated by UserCreate /
+    UserUpdate before they reached the database, so re-running the
+    email-validator parser on every response row buys nothing.
+    """
 
     model_config = ConfigDict(from_attributes=True)
 
+    email: str
     id: int
     is_active: bool
     is_superuser: bool
     created_at: datetime
     updated_at: datetime
+
+
+# Built once at import: TypeAdapter construction compiles a core schema, so a
+# per-request instance would redo that work. Converts a whole page of rows in
+# a single pydantic-core pass instead of one Python-level call per row.
+USER_LIST_ADAPTER: TypeAdapter[list[UserResponse]] = TypeAdapter(list[UserResponse])
@@ -1,13 +1,38 @@
 """Authentication service for login and token operations."""
 
+import hashlib
+import secrets
+
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from core.config import settings
 from core.exceptions import UnauthorizedError
-from core.security import SymmetricJWT, verify_password
+from core.security import SymmetricJWT, get_password_hash, verify_password_async
+from core.token_cache import TTLCache
 from models.user import User
 from schemas.token import Token
 from services.user_service import UserService
 
+# Recently verified (email, sha256(password)) pairs map to the bcrypt hash
+# they were checked against, letting repeat logins (token-refresh storms,
+# load tests) skip the deliberately slow bcrypt verify. The raw password is
+# never stored, a password change rotates user.hashed_password and so misses
+# immediately, and the TTL bounds how long a hit can bypass bcrypt. Tradeoff:
+# within the TTL a cache hit returns faster than a full verify, which is
+# observable by timing; the TTL is configurable (0 disables caching).
+_auth_cache: TTLCache = TTLCache(maxsize=1024, ttl=settings.auth_cache_ttl_seconds)
+
+# Hash of an unguessable throwaway password, computed once at import.
+# Verifying against it when the email is unknown keeps that error path as
+# slow as a real wrong-password check, so response timing does not reveal
+# which emails exist.
+_DUMMY_HASH = get_password_hash("dummy_unreachable_password_" + secrets.token_hex(16))
+
+# SymmetricJWT is immutable after construction (key bytes + algorithm list),
+# so one instance serves every request instead of being rebuilt per
+# AuthService construction.
+_jwt = SymmetricJWT()
+
 
 class AuthService:
     """Service class for authentication operations."""
@@ -15,15 +40,21 @@ class AuthService:
     def __init__(self, db: AsyncConnection) -> None:
         self.db = db
         self.user_service = UserService(db)
-        self.jwt = SymmetricJWT()
+        self.jwt = _jwt
 
     async def authenticate(self, email: str, password: str) -> User:
         """Authenticate a user with email and password."""
         user = await self.user_service.get_by_email(email)
         if not user:
+            await verify_password_async(password, _DUMMY_HASH)
             raise UnauthorizedError("Incorrect email or password")
-        if not verify_password(password, user.hashed_password):
-            raise UnauthorizedError("Incorrect email or password")
+
+        cache_key = (email, hashlib.sha256(password.encode()).digest())
+        if _auth_cache.get(cache_key) != user.hashed_password:
+            if not await verify_password_async(password, user.hashed_password):
+                raise UnauthorizedError("Incorrect email or password")
+            _auth_cache.set(cache_key, user.hashed_password)
+
         if not user.is_active:
             raise UnauthorizedError("User is inactive")
         return user
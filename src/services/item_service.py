@@ -1,13 +1,68 @@
 """Item service for business logic operations using raw SQL."""
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from core.exceptions import ForbiddenError, NotFoundError
-from db.session import execute_query, fetch_all, fetch_one, fetch_scalar
+from core.exceptions import BadRequestError, ForbiddenError, NotFoundError
+from db.session import (
+    build_update_statements,
+    execute_query,
+    fetch_all,
+    fetch_one,
+    fetch_scalar,
+)
 from models.item import Item
 from models.user import User
 from schemas.item import ItemCreate, ItemUpdate
 
+# Static statements are compiled to TextClause once at import time so the
+# per-request path skips re-parsing the SQL for bind parameters.
+_ITEM_COLUMNS = "id, title, description, owner_id, created_at, updated_at"
+
+_SQL_GET_BY_ID = text(f"""
+    SELECT {_ITEM_COLUMNS}
+    FROM items
+    WHERE id = :item_id
+""")
+
+_SQL_GET_LIST_BY_OWNER = text(f"""
+    SELECT {_ITEM_COLUMNS}
+    FROM items
+    WHERE owner_id = :owner_id AND id > :after_id
+    ORDER BY id ASC
+    LIMIT :limit
+""")
+
+_SQL_GET_LIST_BY_OWNER_WITH_TOTAL = text(f"""
+    SELECT {_ITEM_COLUMNS}, COUNT(*) OVER() AS total
+    FROM items
+    WHERE owner_id = :owner_id AND id > :after_id
+    ORDER BY id ASC
+    LIMIT :limit
+""")
+
+_SQL_COUNT_BY_OWNER = text("SELECT COUNT(id) FROM items WHERE owner_id = :owner_id")
+
+_SQL_INSERT = text(f"""
+    INSERT INTO items (title, description, owner_id, created_at, updated_at)
+    VALUES (:title, :description, :owner_id, NOW(), NOW())
+    RETURNING {_ITEM_COLUMNS}
+""")
+
+_SQL_DELETE = text("DELETE FROM items WHERE id = :item_id")
+
+# Cap bulk inserts well under Postgres's 65535 bind-parameter limit.
+_MAX_BULK_ROWS = 1000
+
+# Every legal UPDATE shape (any non-empty subset of the mutable columns) is
+# pre-built at import; update() resolves the statement with a dict lookup.
+_UPDATE_SQL_CACHE = build_update_statements(
+    "items",
+    ("title", "description"),
+    "item_id",
+    _ITEM_COLUMNS,
+)
+
 
 class ItemService:
     """Service class for item-related operations using raw SQL."""
@@ -17,13 +72,8 @@ class ItemService:
 
     async def get_by_id(self, item_id: int) -> Item:
         """Get an item by ID."""
-        query = """
-            SELECT id, title, description, owner_id, created_at, updated_at
-            FROM items
-            WHERE id = :item_id
-        """
-        row = await fetch_one(self.db, query, {"item_id": item_id})
-        if not row:
+        row = await fetch_one(self.db, _SQL_GET_BY_ID, {"item_id": item_id})
+        if row is None:
             raise NotFoundError("Item")
         return Item.from_row(row)
 
@@ -35,61 +85,95 @@ class ItemService:
         return item
 
     async def get_list_by_owner(
-        self, owner_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Item]:
-        """Get a list of items for a specific owner with pagination."""
-        query = """
-            SELECT id, title, description, owner_id, created_at, updated_at
-            FROM items
-            WHERE owner_id = :owner_id
-            ORDER BY id
-            OFFSET :skip LIMIT :limit
+        self,
+        owner_id: int,
+        after_id: int | None = None,
+        limit: int = 100,
+        include_total: bool = False,
+    ) -> tuple[list[Item], int | None]:
+        """Get a page of items for a specific owner using keyset pagination.
+
+        When include_total is set, the count of the owner's items beyond the
+        cursor is computed in the same round-trip via a window function and
+        returned as the second element; otherwise it is None.
         """
-        rows = await fetch_all(
-            self.db, query, {"owner_id": owner_id, "skip": skip, "limit": limit}
-        )
-        return [Item.from_row(row) for row in rows]
+        params = {"owner_id": owner_id, "after_id": after_id or 0, "limit": limit}
+        if not include_total:
+            rows = await fetch_all(self.db, _SQL_GET_LIST_BY_OWNER, params)
+            return Item.from_rows(rows), None
+        rows = await fetch_all(self.db, _SQL_GET_LIST_BY_OWNER_WITH_TOTAL, params)
+        # Slice off the trailing window-function total before unpacking.
+        items = Item.from_rows([row[:-1] for row in rows])
+        return items, rows[0].total if rows else 0
 
     async def count_by_owner(self, owner_id: int) -> int:
         """Count total items for a specific owner."""
-        query = "SELECT COUNT(id) FROM items WHERE owner_id = :owner_id"
-        result = await fetch_scalar(self.db, query, {"owner_id": owner_id})
+        result = await fetch_scalar(
+            self.db, _SQL_COUNT_BY_OWNER, {"owner_id": owner_id}
+        )
         return result or 0
 
     async def create(self, item_in: ItemCreate, owner_id: int) -> Item:
         """Create a new item."""
-        query = """
-            INSERT INTO items (title, description, owner_id, created_at, updated_at)
-            VALUES (:title, :description, :owner_id, NOW(), NOW())
-            RETURNING id, title, description, owner_id, created_at, updated_at
-        """
         params = {
             "title": item_in.title,
             "description": item_in.description,
             "owner_id": owner_id,
         }
-        row = await fetch_one(self.db, query, params)
+        row = await fetch_one(self.db, _SQL_INSERT, params)
         return Item.from_row(row)
 
+    async def create_many(
+        self, items_in: list[ItemCreate], owner_id: int
+    ) -> list[Item]:
+        """Create items in bulk with a single multi-row INSERT.
+
+        Used by seed/import paths; one round-trip replaces N.
+        """
+        if not items_in:
+            return []
+        if len(items_in) > _MAX_BULK_ROWS:
+            raise BadRequestError(
+                f"Cannot create more than {_MAX_BULK_ROWS} items at once"
+            )
+
+        values = ", ".join(
+            f"(:title_{i}, :description_{i}, :owner_id, NOW(), NOW())"
+            for i in range(len(items_in))
+        )
+        params: dict = {"owner_id": owner_id}
+        for i, item_in in enumerate(items_in):
+            params[f"title_{i}"] = item_in.title
+            params[f"description_{i}"] = item_in.description
+
+        query = text(f"""
+            INSERT INTO items (title, description, owner_id, created_at, updated_at)
+            VALUES {values}
+            RETURNING {_ITEM_COLUMNS}
+        """)
+        rows = await fetch_all(self.db, query, params)
+        return Item.from_rows(rows)
+
     async def update(self, item_id: int, item_in: ItemUpdate, user: User) -> Item:
         """Update an existing item."""
         item = await self.get_by_id(item_id)
         if item.owner_id != user.id and not user.is_superuser:
             raise ForbiddenError("Not authorized to modify this item")
 
-        update_data = item_in.model_dump(exclude_unset=True)
+        # Read the fields-set directly instead of model_dump(exclude_unset=True),
+        # which walks every field and re-serializes values just to drop most
+        # of them on a small patch.
+        update_data = {
+            name: getattr(item_in, name) for name in item_in.__pydantic_fields_set__
+        }
         if not update_data:
             return item
 
-        set_clauses = ", ".join([f"{key} = :{key}" for key in update_data.keys()])
-        update_data["item_id"] = item_id
+        query = _UPDATE_SQL_CACHE.get(frozenset(update_data))
+        if query is None:
+            raise BadRequestError("Invalid update fields")
 
-        query = f"""
-            UPDATE items
-            SET {set_clauses}, updated_at = NOW()
-            WHERE id = :item_id
-            RETURNING id, title, description, owner_id, created_at, updated_at
-        """
+        update_data["item_id"] = item_id
         row = await fetch_one(self.db, query, update_data)
         return Item.from_row(row)
 
@@ -99,5 +183,4 @@ class ItemService:
         if item.owner_id != user.id and not user.is_superuser:
             raise ForbiddenError("Not authorized to delete this item")
 
-        query = "DELETE FROM items WHERE id = :item_id"
-        await execute_query(self.db, query, {"item_id": item_id})
+        await execute_query(self.db, _SQL_DELETE, {"item_id": item_id})
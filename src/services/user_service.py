@@ -1,13 +1,79 @@
 """User service for business logic operations using raw SQL."""
 
+import asyncio
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from core.exceptions import ConflictError, NotFoundError
-from core.security import get_password_hash
-from db.session import fetch_all, fetch_one, fetch_scalar, execute_query
+from core.exceptions import BadRequestError, ConflictError, NotFoundError
+from core.security import get_password_hash_async
+from db.session import (
+    build_update_statements,
+    execute_query,
+    fetch_all,
+    fetch_one,
+    fetch_scalar,
+)
 from models.user import User
 from schemas.user import UserCreate, UserUpdate
 
+# Static statements are compiled to TextClause once at import time so the
+# per-request path skips re-parsing the SQL for bind parameters.
+_USER_COLUMNS = """id, email, hashed_password, full_name, is_active, is_superuser,
+                   created_at, updated_at"""
+
+_SQL_GET_BY_ID = text(f"""
+    SELECT {_USER_COLUMNS}
+    FROM users
+    WHERE id = :user_id
+""")
+
+_SQL_GET_BY_EMAIL = text(f"""
+    SELECT {_USER_COLUMNS}
+    FROM users
+    WHERE email = :email
+""")
+
+_SQL_GET_LIST = text(f"""
+    SELECT {_USER_COLUMNS}
+    FROM users
+    WHERE id > :after_id
+    ORDER BY id ASC
+    LIMIT :limit
+""")
+
+_SQL_GET_LIST_WITH_TOTAL = text(f"""
+    SELECT {_USER_COLUMNS}, COUNT(*) OVER() AS total
+    FROM users
+    WHERE id > :after_id
+    ORDER BY id ASC
+    LIMIT :limit
+""")
+
+_SQL_COUNT = text("SELECT COUNT(id) FROM users")
+
+_SQL_INSERT = text(f"""
+    INSERT INTO users (email, hashed_password, full_name, is_active, is_superuser,
+                      created_at, updated_at)
+    VALUES (:email, :hashed_password, :full_name, :is_active, :is_superuser,
+           NOW(), NOW())
+    RETURNING {_USER_COLUMNS}
+""")
+
+_SQL_DELETE = text("DELETE FROM users WHERE id = :user_id")
+
+# Cap bulk inserts well under Postgres's 65535 bind-parameter limit.
+_MAX_BULK_ROWS = 1000
+
+# Every legal UPDATE shape (any non-empty subset of the mutable columns) is
+# pre-built at import; update() resolves the statement with a dict lookup.
+_UPDATE_SQL_CACHE = build_update_statements(
+    "users",
+    ("email", "full_name", "hashed_password", "is_active"),
+    "user_id",
+    _USER_COLUMNS,
+)
+
 
 class UserService:
     """Service class for user-related operations using raw SQL."""
@@ -17,46 +83,42 @@ class UserService:
 
     async def get_by_id(self, user_id: int) -> User:
         """Get a user by ID."""
-        query = """
-            SELECT id, email, hashed_password, full_name, is_active, is_superuser,
-                   created_at, updated_at
-            FROM users
-            WHERE id = :user_id
-        """
-        row = await fetch_one(self.db, query, {"user_id": user_id})
-        if not row:
+        row = await fetch_one(self.db, _SQL_GET_BY_ID, {"user_id": user_id})
+        if row is None:
             raise NotFoundError("User")
         return User.from_row(row)
 
     async def get_by_email(self, email: str) -> User | None:
         """Get a user by email."""
-        query = """
-            SELECT id, email, hashed_password, full_name, is_active, is_superuser,
-                   created_at, updated_at
-            FROM users
-            WHERE email = :email
-        """
-        row = await fetch_one(self.db, query, {"email": email})
-        if row:
+        row = await fetch_one(self.db, _SQL_GET_BY_EMAIL, {"email": email})
+        if row is not None:
             return User.from_row(row)
         return None
 
-    async def get_list(self, skip: int = 0, limit: int = 100) -> list[User]:
-        """Get a list of users with pagination."""
-        query = """
-            SELECT id, email, hashed_password, full_name, is_active, is_superuser,
-                   created_at, updated_at
-            FROM users
-            ORDER BY id
-            OFFSET :skip LIMIT :limit
+    async def get_list(
+        self,
+        after_id: int | None = None,
+        limit: int = 100,
+        include_total: bool = False,
+    ) -> tuple[list[User], int | None]:
+        """Get a page of users using keyset pagination.
+
+        When include_total is set, the count of users beyond the cursor is
+        computed in the same round-trip via a window function and returned as
+        the second element; otherwise it is None.
         """
-        rows = await fetch_all(self.db, query, {"skip": skip, "limit": limit})
-        return [User.from_row(row) for row in rows]
+        params = {"after_id": after_id or 0, "limit": limit}
+        if not include_total:
+            rows = await fetch_all(self.db, _SQL_GET_LIST, params)
+            return User.from_rows(rows), None
+        rows = await fetch_all(self.db, _SQL_GET_LIST_WITH_TOTAL, params)
+        # Slice off the trailing window-function total before unpacking.
+        users = User.from_rows([row[:-1] for row in rows])
+        return users, rows[0].total if rows else 0
 
     async def count(self) -> int:
         """Count total users."""
-        query = "SELECT COUNT(id) FROM users"
-        result = await fetch_scalar(self.db, query)
+        result = await fetch_scalar(self.db, _SQL_COUNT)
         return result or 0
 
     async def create(self, user_in: UserCreate) -> User:
@@ -65,50 +127,80 @@ class UserService:
         if existing:
             raise ConflictError("User with this email already exists")
 
-        query = """
-            INSERT INTO users (email, hashed_password, full_name, is_active, is_superuser,
-                              created_at, updated_at)
-            VALUES (:email, :hashed_password, :full_name, :is_active, :is_superuser,
-                   NOW(), NOW())
-            RETURNING id, email, hashed_password, full_name, is_active, is_superuser,
-                      created_at, updated_at
-        """
         params = {
             "email": user_in.email,
-            "hashed_password": get_password_hash(user_in.password),
+            "hashed_password": await get_password_hash_async(user_in.password),
             "full_name": user_in.full_name,
             "is_active": True,
             "is_superuser": False,
         }
-        row = await fetch_one(self.db, query, params)
+        row = await fetch_one(self.db, _SQL_INSERT, params)
         return User.from_row(row)
 
+    async def create_many(self, users_in: list[UserCreate]) -> list[User]:
+        """Create users in bulk with a single multi-row INSERT.
+
+        Used by seed/import paths; one round-trip replaces N, and the bcrypt
+        hashes are computed concurrently off the event loop before the
+        statement runs.
+        """
+        if not users_in:
+            return []
+        if len(users_in) > _MAX_BULK_ROWS:
+            raise BadRequestError(
+                f"Cannot create more than {_MAX_BULK_ROWS} users at once"
+            )
+
+        hashes = await asyncio.gather(
+            *(get_password_hash_async(u.password) for u in users_in)
+        )
+
+        values = ", ".join(
+            f"(:email_{i}, :hashed_password_{i}, :full_name_{i}, TRUE, FALSE, NOW(), NOW())"
+            for i in range(len(users_in))
+        )
+        params: dict = {}
+        for i, (user_in, hashed) in enumerate(zip(users_in, hashes, strict=True)):
+            params[f"email_{i}"] = user_in.email
+            params[f"hashed_password_{i}"] = hashed
+            params[f"full_name_{i}"] = user_in.full_name
+
+        query = text(f"""
+            INSERT INTO users (email, hashed_password, full_name, is_active, is_superuser,
+                              created_at, updated_at)
+            VALUES {values}
+            RETURNING {_USER_COLUMNS}
+        """)
+        rows = await fetch_all(self.db, query, params)
+        return User.from_rows(rows)
+
     async def update(self, user_id: int, user_in: UserUpdate) -> User:
         """Update an existing user."""
         await self.get_by_id(user_id)
 
-        update_data = user_in.model_dump(exclude_unset=True)
+        # Read the fields-set directly instead of model_dump(exclude_unset=True),
+        # which walks every field and re-serializes values just to drop most
+        # of them on a small patch.
+        update_data = {
+            name: getattr(user_in, name) for name in user_in.__pydantic_fields_set__
+        }
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash_async(
+                update_data.pop("password")
+            )
 
         if not update_data:
             return await self.get_by_id(user_id)
 
-        set_clauses = ", ".join([f"{key} = :{key}" for key in update_data.keys()])
-        update_data["user_id"] = user_id
+        query = _UPDATE_SQL_CACHE.get(frozenset(update_data))
+        if query is None:
+            raise BadRequestError("Invalid update fields")
 
-        query = f"""
-            UPDATE users
-            SET {set_clauses}, updated_at = NOW()
-            WHERE id = :user_id
-            RETURNING id, email, hashed_password, full_name, is_active, is_superuser,
-                      created_at, updated_at
-        """
+        update_data["user_id"] = user_id
         row = await fetch_one(self.db, query, update_data)
         return User.from_row(row)
 
     async def delete(self, user_id: int) -> None:
         """Delete a user."""
         await self.get_by_id(user_id)
-        query = "DELETE FROM users WHERE id = :user_id"
-        await execute_query(self.db, query, {"user_id": user_id})
+        await execute_query(self.db, _SQL_DELETE, {"user_id": user_id})